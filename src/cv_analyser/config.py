@@ -3,9 +3,10 @@ Configuration management for CV Job Analyzer.
 Uses pydantic-settings for environment variable validation.
 """
 
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
-from typing import Optional
 
 
 class Settings(BaseSettings):
@@ -27,6 +28,7 @@ class Settings(BaseSettings):
     groq_model: str = Field(default="llama-3.3-70b-versatile", alias="GROQ_MODEL")
     groq_temperature: float = Field(default=0.3, alias="GROQ_TEMPERATURE")
     groq_max_tokens: int = Field(default=2000, alias="GROQ_MAX_TOKENS")
+    groq_concurrency: int = Field(default=8, alias="GROQ_CONCURRENCY")
     
     # Serper Settings
     serper_num_results: int = Field(default=5, alias="SERPER_NUM_RESULTS")
@@ -40,20 +42,13 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-# Global settings instance
-settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get or create settings instance."""
-    global settings
-    if settings is None:
-        settings = Settings()
-    return settings
+    """Get the cached settings instance (parses .env at most once)."""
+    return Settings()
 
 
 def load_settings() -> Settings:
     """Force reload settings from environment."""
-    global settings
-    settings = Settings()
-    return settings
\ No newline at end of file
+    get_settings.cache_clear()
+    return get_settings()
\ No newline at end of file
@@ -1,509 +1,761 @@
-"""
-Groq API service for CV analysis using Llama models.
-Uses settings from .env file for model configuration.
-"""
-
-import json
-from typing import Optional
-
-# Import Groq SDK
-try:
-    from groq import Groq
-except ImportError as e:
-    raise ImportError(
-        "Groq SDK not installed. Please run: pip install groq"
-    ) from e
-
-from loguru import logger
-from cv_analyser.models.schemas import CVAnalysis
-from cv_analyser.config import get_settings
-
-
-class GroqAPIError(Exception):
-    """Custom exception for Groq API errors."""
-    pass
-
-
-class GroqService:
-    """Service for interacting with Groq API using official SDK."""
-    
-    def __init__(self, api_key: Optional[str] = None):
-        """
-        Initialize Groq service.
-        
-        Args:
-            api_key: Groq API key (if None, loads from settings)
-        """
-        try:
-            self.settings = get_settings()
-        except Exception as e:
-            logger.warning(f"Could not load settings: {e}")
-            self.settings = None
-        
-        self.api_key = api_key or (self.settings.groq_api_key if self.settings else None)
-        
-        if not self.api_key:
-            raise ValueError("Groq API key not provided. Set GROQ_API_KEY environment variable.")
-        
-        # Initialize Groq client
-        try:
-            self.client = Groq(api_key=self.api_key)
-            logger.debug("Groq client initialized successfully")
-        except Exception as e:
-            raise GroqAPIError(f"Failed to initialize Groq client: {str(e)}")
-    
-    def _get_model_config(self):
-        """Get model configuration from settings or use defaults."""
-        defaults = {
-            "model": "llama-3.3-70b-versatile",
-            "temperature": 0.1,
-            "max_tokens": 8192,
-        }
-        
-        if self.settings:
-            return {
-                "model": getattr(self.settings, "groq_model", defaults["model"]),
-                "temperature": getattr(self.settings, "groq_temperature", defaults["temperature"]),
-                "max_tokens": getattr(self.settings, "groq_max_tokens", defaults["max_tokens"]),
-            }
-        return defaults
-    
-    def _build_analysis_prompt(self, cv_text: str, job_description: str) -> str:
-        """
-        Build a robust prompt that FORCES the model to output meaningful JSON only.
-        Prevents:
-        - echoing the CV / JD
-        - empty / all-zero analysis
-        """
-
-        # Truncate inputs to avoid model drift from very long prompts
-        max_cv_length = 2800
-        max_jd_length = 1800
-
-        if len(cv_text) > max_cv_length:
-            cv_text = cv_text[:max_cv_length] + "..."
-            logger.warning(f"CV truncated to {max_cv_length} characters")
-
-        if len(job_description) > max_jd_length:
-            job_description = job_description[:max_jd_length] + "..."
-            logger.warning(f"Job description truncated to {max_jd_length} characters")
-
-        return f"""
-SYSTEM INSTRUCTION (READ CAREFULLY AND FOLLOW STRICTLY):
-
-You are an AI career analyst. Your ONLY task is to compare a CV to a Job Description and return a STRICT JSON object.
-
-ABSOLUTE RULES:
-- DO NOT repeat or rewrite the CV text.
-- DO NOT repeat or rewrite the Job Description text.
-- DO NOT output explanations, markdown, commentary, or any text outside the JSON.
-- The output MUST:
-  - Start with '{{'
-  - End with '}}'
-  - Contain EXACTLY the required keys (no more, no less).
-  - NEVER omit any field.
-  - NEVER return all zeros or empty lists.
-  - NEVER leave skill_gap_analysis_summary empty.
-
-You must deeply analyze the CV against the Job Description and produce a realistic, non-trivial evaluation.
-
-REQUIRED JSON FORMAT (KEYS AND TYPES):
-
-{{
-  "overall_score": 0,
-  "skills_match": 0,
-  "experience_match": 0,
-  "education_match": 0,
-  "matching_skills": [],
-  "missing_skills": [],
-  "youtube_search_query": "",
-  "skill_gap_analysis_summary": ""
-}}
-
-MEANINGS:
-- overall_score: integer 0–100, overall match between candidate and role.
-- skills_match: integer 0–100, how well their skills align with the JD.
-- experience_match: integer 0–100, how well their years/type of experience align.
-- education_match: integer 0–100, how well education fits the requirements.
-- matching_skills: list of STRINGS describing strong or matching skills.
-- missing_skills: list of STRINGS describing concrete missing/weak skills.
-- youtube_search_query: a single STRING query for the most important missing skill.
-  - MUST end with ", latest on youtube".
-- skill_gap_analysis_summary: 150–250 word professional narrative summarising:
-  - key strengths
-  - most critical gaps
-  - how gaps affect readiness
-  - what to learn next.
-
-IMPORTANT CONSTRAINTS:
-- DO NOT use nested objects inside matching_skills or missing_skills.
-  Example: ["TensorFlow", "Kubernetes", "Azure DevOps"], NOT [{{"name": "TensorFlow"}}].
-- DO NOT return placeholder or dummy analysis.
-- DO NOT return all scores as 0.
-- DO NOT return empty arrays for both matching_skills and missing_skills.
-- DO NOT leave skill_gap_analysis_summary blank.
-
-BAD OUTPUT EXAMPLE (NEVER DO THIS):
-{{
-  "overall_score": 0,
-  "skills_match": 0,
-  "experience_match": 0,
-  "education_match": 0,
-  "matching_skills": [],
-  "missing_skills": [],
-  "youtube_search_query": "",
-  "skill_gap_analysis_summary": ""
-}}
-
-GOOD OUTPUT EXAMPLE (STRUCTURE ONLY, CONTENT WILL DIFFER):
-{{
-  "overall_score": 68,
-  "skills_match": 72,
-  "experience_match": 65,
-  "education_match": 80,
-  "matching_skills": [
-    "Strong Python for data engineering and ML",
-    "Hands-on experience with AWS (Lambda, S3, SageMaker)",
-    "Good foundation in ML model training and evaluation"
-  ],
-  "missing_skills": [
-    "Kubernetes for container orchestration",
-    "Experience with Spark for large-scale data processing",
-    "Formal MLOps tools such as MLflow"
-  ],
-  "youtube_search_query": "Kubernetes for data engineers tutorial, latest on youtube",
-    "skill_gap_analysis_summary": "..."
-}}
-
-NOW ANALYZE THE FOLLOWING DATA:
-
-CV TEXT (DO NOT ECHO THIS BACK):
-{cv_text}
-
-JOB DESCRIPTION TEXT (DO NOT ECHO THIS BACK):
-{job_description}
-
-NOW OUTPUT ONLY A VALID, NON-EMPTY JSON OBJECT IN THE REQUIRED FORMAT.
-START WITH '{{' AND END WITH '}}'. NO OTHER TEXT.
-"""
-    
-    def analyze_cv(self, cv_text: str, job_description: str) -> CVAnalysis:
-        """
-        Analyze CV against job description using Groq API.
-        
-        Args:
-            cv_text: Candidate's CV text
-            job_description: Job description text
-            
-        Returns:
-            CVAnalysis: Analysis results
-            
-        Raises:
-            GroqAPIError: If API call fails
-        """
-        try:
-            # Build prompt
-            prompt = self._build_analysis_prompt(cv_text, job_description)
-            
-            # Get model configuration from .env
-            config = self._get_model_config()
-            
-            # Log configuration being used
-            logger.info(f"Using model: {config['model']}")
-            logger.info(f"Temperature: {config['temperature']}, Max tokens: {config['max_tokens']}")
-            
-            # Make API request using official SDK
-            logger.info("Sending request to Groq API...")
-            logger.info(f"Prompt length: {len(prompt)} characters")
-            logger.debug(f"Prompt preview: {prompt[:300]}...")
-            
-            completion = self.client.chat.completions.create(
-                model=config["model"],
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a career coach AI that helps job seekers to improve their skills so they are qualified for desired jobs.",
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    },
-                ],
-                temperature=config["temperature"],
-                max_completion_tokens=config["max_tokens"],
-            )
-            
-            # Extract response content
-            result_text = completion.choices[0].message.content
-            logger.info(f"Received response, length: {len(result_text)} characters")
-            logger.debug(f"Raw API response (first 300 chars): {result_text[:300]}")
-            
-            # Parse JSON response
-            try:
-                clean_text = result_text.strip()
-                if clean_text.startswith("```json"):
-                    clean_text = clean_text[7:]
-                if clean_text.startswith("```"):
-                    clean_text = clean_text[3:]
-                if clean_text.endswith("```"):
-                    clean_text = clean_text[:-3]
-                clean_text = clean_text.strip()
-                
-                analysis_data = json.loads(clean_text)
-                logger.debug("Successfully parsed JSON response")
-            
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error: {str(e)}")
-                logger.error(f"Response text (first 500 chars): {result_text[:500]}")
-                
-                # Try to find JSON in the response
-                import re
-                json_match = re.search(r"\{.*\}", result_text, re.DOTALL)
-                if json_match:
-                    try:
-                        analysis_data = json.loads(json_match.group(0))
-                        logger.info("Successfully extracted JSON using regex")
-                    except Exception:
-                        raise GroqAPIError(
-                            "Model returned invalid JSON even after extraction. "
-                            "Try again, or slightly shorten your CV / job description."
-                        )
-                else:
-                    raise GroqAPIError(
-                        "Model did not return JSON format. "
-                        f"Current model: {config['model']}"
-                    )
-            
-            # Log what we received to debug
-            logger.info(f"Received JSON keys: {list(analysis_data.keys())}")
-            logger.info(f"Full JSON response: {json.dumps(analysis_data, indent=2)}")
-            
-            # Convert to our CVAnalysis model
-            try:
-                # Extract values with all possible key variations
-                overall = (
-                    analysis_data.get("overall_score")
-                    or analysis_data.get("Overall Match Score")
-                    or analysis_data.get("Match Score")
-                    or analysis_data.get("match_score")
-                    or 0
-                )
-
-                skills = (
-                    analysis_data.get("skills_match")
-                    or analysis_data.get("Skills Match")
-                    or 0
-                )
-
-                experience = (
-                    analysis_data.get("experience_match")
-                    or analysis_data.get("Experience Match")
-                    or 0
-                )
-
-                education = (
-                    analysis_data.get("education_match")
-                    or analysis_data.get("Education Match")
-                    or 0
-                )
-
-                strengths = (
-                    analysis_data.get("matching_skills")
-                    or analysis_data.get("strong_skills")
-                    or analysis_data.get("matching_strong_skills")
-                    or analysis_data.get("Matching/Strong Skills")
-                    or analysis_data.get("Matching / strong skills")
-                    or analysis_data.get("Matching Skills")
-                    or []
-                )
-
-                missing = (
-                    analysis_data.get("missing_skills")
-                    or analysis_data.get("missing_weak_skills")
-                    or analysis_data.get("Missing/Weak Skills")
-                    or analysis_data.get("Missing / weak skills")
-                    or analysis_data.get("Missing Skills")
-                    or []
-                )
-
-                summary = (
-                    analysis_data.get("skill_gap_analysis_summary")
-                    or analysis_data.get("Summary")
-                    or analysis_data.get("Skill Gap Summary")
-                    or ""
-                )
-
-                query = (
-                    analysis_data.get("youtube_search_query")
-                    or analysis_data.get("Search Query")
-                    or analysis_data.get("YouTube search query")
-                    or analysis_data.get("YouTube Search Query")
-                    or ""
-                )
-
-                logger.info(
-                    f"Extracted values - Overall: {overall}, Skills: {skills}, "
-                    f"Exp: {experience}, Edu: {education}"
-                )
-                logger.info(
-                    f"Strengths count (raw): {len(strengths)}, Missing count (raw): {len(missing)}"
-                )
-
-                # ---- Helper to detect nearly-empty lists ----
-                def _is_truly_empty_list(lst):
-                    if not lst:
-                        return True
-                    cleaned = [
-                        str(x).strip().lower()
-                        for x in lst
-                        if str(x).strip()
-                    ]
-                    if not cleaned:
-                        return True
-                    if all(x in ("not specified", "n/a", "none") for x in cleaned):
-                        return True
-                    return False
-
-                # 🔹 Normalize strengths to list[str]
-                strengths_norm = []
-                if isinstance(strengths, list):
-                    for item in strengths:
-                        if isinstance(item, str):
-                            strengths_norm.append(item)
-                        elif isinstance(item, dict):
-                            # e.g. {"name": "Python", "importance": 9}
-                            name = item.get("name") or item.get("skill") or str(item)
-                            importance = item.get("importance")
-                            if importance is not None:
-                                strengths_norm.append(f"{name} (importance {importance}/10)")
-                            else:
-                                strengths_norm.append(name)
-                        else:
-                            strengths_norm.append(str(item))
-                elif isinstance(strengths, str):
-                    strengths_norm = [strengths]
-
-                # 🔹 Normalize missing_skills to list[str]
-                missing_norm = []
-                if isinstance(missing, list):
-                    for item in missing:
-                        if isinstance(item, str):
-                            missing_norm.append(item)
-                        elif isinstance(item, dict):
-                            name = item.get("name") or item.get("skill") or str(item)
-                            importance = item.get("importance")
-                            if importance is not None:
-                                missing_norm.append(f"{name} (importance {importance}/10)")
-                            else:
-                                missing_norm.append(name)
-                        else:
-                            missing_norm.append(str(item))
-                elif isinstance(missing, str):
-                    missing_norm = [missing]
-
-                logger.info(
-                    f"Normalized strengths: {strengths_norm}, "
-                    f"Normalized missing_skills: {missing_norm}"
-                )
-
-                # --- Sanity check: detect completely empty / useless analysis ---
-                all_zero_scores = (
-                    int(overall) == 0
-                    and int(skills) == 0
-                    and int(experience) == 0
-                    and int(education) == 0
-                )
-
-                no_real_strengths = _is_truly_empty_list(strengths_norm)
-                no_real_missing = _is_truly_empty_list(missing_norm)
-                empty_summary = not summary or not summary.strip()
-                empty_query = not query or not query.strip()
-
-                if (
-                    all_zero_scores
-                    and no_real_strengths
-                    and no_real_missing
-                    and empty_summary
-                    and empty_query
-                ):
-                    logger.error("Model returned structurally valid but COMPLETELY EMPTY analysis.")
-                    raise GroqAPIError(
-                        "The AI returned an empty analysis. "
-                        "Please try again or slightly shorten your CV / job description."
-                    )
-
-                converted_data = {
-                    "overall_score": int(overall),
-                    "skills_match": int(skills),
-                    "experience_match": int(experience),
-                    "education_match": int(education),
-                    "strengths": strengths_norm if strengths_norm else ["Not specified"],
-                    "missing_skills": missing_norm if missing_norm else ["Not specified"],
-                    "gaps_analysis": (
-                        summary.strip()
-                        if summary and summary.strip()
-                        else "Analysis not available. Please review the strengths and missing skills above."
-                    ),
-                    "youtube_search_query": query if query else "skill improvement tutorial",
-                }
-
-                # Log what we're trying to create
-                logger.debug(f"Converted data: {converted_data}")
-
-                # Validate using Pydantic model
-                analysis = CVAnalysis(**converted_data)
-
-                logger.info("✅ Analysis complete!")
-                logger.info(f"Overall: {analysis.overall_score}/100")
-                logger.info(
-                    f"Skills: {analysis.skills_match}/100, "
-                    f"Experience: {analysis.experience_match}/100, "
-                    f"Education: {analysis.education_match}/100"
-                )
-
-                return analysis
-
-            except Exception as e:
-                logger.error(f"Error converting response to CVAnalysis: {str(e)}")
-                logger.error(f"Response data: {analysis_data}")
-                raise GroqAPIError(f"Failed to parse API response into valid format: {str(e)}")
-            
-        except GroqAPIError:
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in analyze_cv: {str(e)}")
-            logger.exception("Full traceback:")
-            
-            error_msg = str(e).lower()
-            if "authentication" in error_msg or "api key" in error_msg or "401" in error_msg:
-                raise GroqAPIError("Invalid API key. Please check your GROQ_API_KEY in .env file.")
-            elif "rate limit" in error_msg or "429" in error_msg:
-                raise GroqAPIError("Rate limit exceeded. Please wait a moment and try again.")
-            elif "timeout" in error_msg:
-                raise GroqAPIError("Request timed out. Please try again.")
-            elif "model" in error_msg and "not found" in error_msg:
-                raise GroqAPIError(
-                    f"Model not found. Check GROQ_MODEL in .env file. Current: {self._get_model_config()['model']}"
-                )
-            else:
-                raise GroqAPIError(f"Analysis failed: {str(e)}")
-    
-    def test_connection(self) -> bool:
-        """
-        Test connection to Groq API.
-        
-        Returns:
-            bool: True if connection successful
-        """
-        try:
-            config = self._get_model_config()
-            self.client.chat.completions.create(
-                model=config["model"],
-                messages=[{"role": "user", "content": "test"}],
-                max_completion_tokens=10,
-            )
-            logger.debug(f"Connection test successful with model: {config['model']}")
-            return True
-        except Exception as e:
-            logger.error(f"Connection test failed: {str(e)}")
-            return False
+"""
+Groq API service for CV analysis using Llama models.
+Uses settings from .env file for model configuration.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+
+# The Groq SDK import is deferred to first service construction: it drags in
+# httpx and a tree of pydantic models, which is pure cold-start cost for code
+# paths that never talk to Groq. _load_groq_sdk fills these module globals.
+Groq = None
+AsyncGroq = None
+
+# Errors worth retrying: rate limits, 5xx and connection/timeout failures.
+# Auth and validation errors are not in this tuple and fail immediately.
+_TRANSIENT_ERRORS: tuple = ()
+_MAX_ATTEMPTS = 3
+
+
+def _load_groq_sdk():
+    """Import the Groq SDK on first use."""
+    global Groq, AsyncGroq, _TRANSIENT_ERRORS
+    if Groq is not None:
+        return
+    try:
+        import groq
+    except ImportError as e:
+        raise ImportError(
+            "Groq SDK not installed. Please run: pip install groq"
+        ) from e
+    Groq = groq.Groq
+    AsyncGroq = groq.AsyncGroq
+    _TRANSIENT_ERRORS = (
+        groq.APIConnectionError,
+        groq.APITimeoutError,
+        groq.InternalServerError,
+        groq.RateLimitError,
+    )
+
+# orjson parses several times faster than stdlib json; optional dependency
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from loguru import logger
+from pydantic import ValidationError
+
+from cv_analyser.models.schemas import CVAnalysis, CVAnalysisRaw
+from cv_analyser.config import get_settings
+
+
+class GroqAPIError(Exception):
+    """Custom exception for Groq API errors."""
+    pass
+
+
+def _json_loads(text: str):
+    """Parse JSON text with orjson when available, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_pretty(data) -> str:
+    """Indent-formatted JSON for log output."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+# Process-local LRU of completed analyses keyed by content hash. Values are
+# plain model_dump() dicts rather than CVAnalysis objects, so a hit pays only
+# a cheap model_validate() instead of a full Groq round-trip.
+_ANALYSIS_CACHE: "OrderedDict[str, dict]" = OrderedDict()
+_ANALYSIS_CACHE_MAX = 64
+
+# Salvage pattern for responses that wrap the JSON object in prose,
+# compiled once at import instead of inside the error path.
+_JSON_EXTRACT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Placeholder strings the model uses when it has nothing to say for a list
+_EMPTY_SENTINELS = frozenset({"not specified", "n/a", "none"})
+
+
+def _is_truly_empty_list(lst) -> bool:
+    """True when a skill list is empty or holds only placeholder entries."""
+    if not lst:
+        return True
+    cleaned = [
+        str(x).strip().lower()
+        for x in lst
+        if str(x).strip()
+    ]
+    if not cleaned:
+        return True
+    return all(x in _EMPTY_SENTINELS for x in cleaned)
+
+
+def _normalize_skill_list(raw) -> List[str]:
+    """
+    Coerce a model-provided skill field into a flat list of strings.
+
+    Handles bare strings, lists of strings, and lists of dicts like
+    {"name": "Python", "importance": 9}. Placeholder entries such as
+    "Not specified" are dropped here so an empty list downstream really
+    means empty and callers never offer a sentinel as a skill to learn.
+    """
+    if isinstance(raw, str):
+        raw = [raw]
+    if not isinstance(raw, list):
+        return []
+
+    normalized = []
+    for item in raw:
+        if isinstance(item, str):
+            normalized.append(item)
+        elif isinstance(item, dict):
+            name = item.get("name") or item.get("skill") or str(item)
+            importance = item.get("importance")
+            if importance is not None:
+                normalized.append(f"{name} (importance {importance}/10)")
+            else:
+                normalized.append(name)
+        else:
+            normalized.append(str(item))
+    return [
+        s for s in normalized
+        if s.strip() and s.strip().lower() not in _EMPTY_SENTINELS
+    ]
+
+
+# Key spellings the model has been seen to emit, matched against a
+# lowercased view of the response so casing variants collapse for free.
+_KEY_ALIASES = {
+    "overall": ("overall_score", "overall match score", "match score", "match_score"),
+    "skills": ("skills_match", "skills match"),
+    "experience": ("experience_match", "experience match"),
+    "education": ("education_match", "education match"),
+    "strengths": (
+        "matching_skills",
+        "strong_skills",
+        "matching_strong_skills",
+        "matching/strong skills",
+        "matching / strong skills",
+        "matching skills",
+    ),
+    "missing": (
+        "missing_skills",
+        "missing_weak_skills",
+        "missing/weak skills",
+        "missing / weak skills",
+        "missing skills",
+    ),
+    "summary": ("skill_gap_analysis_summary", "summary", "skill gap summary"),
+    "query": ("youtube_search_query", "search query", "youtube search query"),
+}
+
+
+def _analysis_cache_key(cv_text: str, job_description: str, config: dict) -> str:
+    """Content hash identifying one (CV, JD, model, temperature) combination."""
+    payload = b"\x00".join([
+        cv_text.encode(),
+        job_description.encode(),
+        str(config["model"]).encode(),
+        str(config["temperature"]).encode(),
+    ])
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# Truncation budgets for the user message, expressed in tokens. Llama-family
+# tokenizers average roughly 4 characters per token on English prose, which
+# lets us budget in model terms without pulling in a tokenizer dependency.
+_CHARS_PER_TOKEN = 4
+_MAX_CV_TOKENS = 700
+_MAX_JD_TOKENS = 450
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Truncate text to roughly max_tokens, cutting at a word boundary."""
+    limit = max_tokens * _CHARS_PER_TOKEN
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(" ", 0, limit)
+    if cut <= 0:
+        cut = limit
+    return text[:cut] + "..."
+
+
+@lru_cache(maxsize=128)
+def _build_user_prompt(cv_text: str, job_description: str) -> str:
+    """
+    Build the compact per-request user message.
+
+    All instructions live in the static SYSTEM_PROMPT; this only carries the
+    variable payload, truncated so very long inputs cannot blow up token
+    costs or cause model drift. Memoized because retries and batch runs
+    frequently rebuild the prompt for the same inputs.
+    """
+    truncated_cv = _truncate_to_tokens(cv_text, _MAX_CV_TOKENS)
+    if truncated_cv is not cv_text:
+        logger.warning(f"CV truncated to ~{_MAX_CV_TOKENS} tokens")
+        cv_text = truncated_cv
+
+    truncated_jd = _truncate_to_tokens(job_description, _MAX_JD_TOKENS)
+    if truncated_jd is not job_description:
+        logger.warning(f"Job description truncated to ~{_MAX_JD_TOKENS} tokens")
+        job_description = truncated_jd
+
+    return (
+        f"CV TEXT:\n{cv_text}\n\n"
+        f"JOB DESCRIPTION:\n{job_description}\n\n"
+        "Return the analysis JSON."
+    )
+
+
+# All invariant instruction text lives here, so each request only spends
+# input tokens on the CV/JD payload itself - prefill cost and time-to-first-
+# token scale with prompt length.
+SYSTEM_PROMPT = """\
+You are an AI career analyst. Compare a CV to a job description and return ONLY a strict JSON object - no markdown, no commentary, and never echo the CV or job description text back.
+
+The object must contain EXACTLY these keys:
+{
+  "overall_score": <int 0-100, overall candidate/role match>,
+  "skills_match": <int 0-100, skill alignment with the JD>,
+  "experience_match": <int 0-100, years/type of experience alignment>,
+  "education_match": <int 0-100, education fit>,
+  "matching_skills": [<strings describing strong or matching skills>],
+  "missing_skills": [<strings describing concrete missing or weak skills>],
+  "youtube_search_query": "<query for the most important missing skill, MUST end with ', latest on youtube'>",
+  "skill_gap_analysis_summary": "<150-250 word professional narrative: key strengths, most critical gaps, how they affect readiness, what to learn next>"
+}
+
+Rules: produce a realistic, non-trivial evaluation. Never omit a key, return all-zero scores, leave both skill lists empty, put nested objects inside the skill lists (use plain strings like "Kubernetes"), or leave skill_gap_analysis_summary blank.
+"""
+
+
+class GroqService:
+    """Service for interacting with Groq API using official SDK."""
+
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Initialize Groq service.
+
+        Args:
+            api_key: Groq API key (if None, loads from settings)
+        """
+        _load_groq_sdk()
+
+        try:
+            self.settings = get_settings()
+        except Exception as e:
+            logger.warning(f"Could not load settings: {e}")
+            self.settings = None
+
+        self.api_key = api_key or (self.settings.groq_api_key if self.settings else None)
+
+        if not self.api_key:
+            raise ValueError("Groq API key not provided. Set GROQ_API_KEY environment variable.")
+
+        # Initialize Groq client
+        try:
+            self.client = Groq(api_key=self.api_key)
+            logger.debug("Groq client initialized successfully")
+        except Exception as e:
+            raise GroqAPIError(f"Failed to initialize Groq client: {str(e)}")
+
+        # Settings are immutable for the lifetime of the service, so the
+        # model configuration is derived once here instead of per request.
+        self._model_config = self._build_model_config()
+
+    def _build_model_config(self):
+        """Derive model configuration from settings or use defaults."""
+        defaults = {
+            "model": "llama-3.3-70b-versatile",
+            "temperature": 0.1,
+            "max_tokens": 8192,
+        }
+
+        if self.settings:
+            return {
+                "model": getattr(self.settings, "groq_model", defaults["model"]),
+                "temperature": getattr(self.settings, "groq_temperature", defaults["temperature"]),
+                "max_tokens": getattr(self.settings, "groq_max_tokens", defaults["max_tokens"]),
+            }
+        return defaults
+
+    def _get_model_config(self):
+        """Get the model configuration computed at init."""
+        return self._model_config
+
+    def _build_analysis_prompt(self, cv_text: str, job_description: str) -> str:
+        """Build the compact per-request user message (memoized)."""
+        return _build_user_prompt(cv_text, job_description)
+
+    def _build_messages(self, prompt: str) -> List[dict]:
+        """Assemble the chat messages for one analysis request."""
+        return [
+            {
+                "role": "system",
+                "content": SYSTEM_PROMPT,
+            },
+            {
+                "role": "user",
+                "content": prompt,
+            },
+        ]
+
+    @staticmethod
+    def _collect_stream(stream, on_token: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Accumulate a streamed completion into a single string.
+
+        Tracks brace depth across deltas and, once the first JSON object
+        appears balanced, confirms completeness with ``raw_decode`` and stops
+        consuming - the model occasionally appends prose after the JSON.
+        """
+        decoder = json.JSONDecoder()
+        parts = []
+        depth = 0
+        seen_object = False
+
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+
+            parts.append(delta)
+            if on_token is not None:
+                on_token(delta)
+
+            for char in delta:
+                if char == '{':
+                    depth += 1
+                    seen_object = True
+                elif char == '}':
+                    depth -= 1
+
+            if seen_object and depth <= 0:
+                buffer = "".join(parts)
+                start = buffer.find('{')
+                try:
+                    decoder.raw_decode(buffer[start:])
+                except json.JSONDecodeError:
+                    # Braces inside string values can fool the depth counter;
+                    # keep streaming until the object actually parses.
+                    continue
+                logger.debug("Complete JSON object received, closing stream early")
+                stream.close()
+                break
+
+        return "".join(parts)
+
+    @staticmethod
+    def _response_format() -> dict:
+        """Structured-output spec telling Groq to emit CVAnalysisRaw exactly."""
+        return {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "CVAnalysisRaw",
+                "schema": CVAnalysisRaw.model_json_schema(),
+                "strict": True,
+            },
+        }
+
+    def _parse_analysis_response(
+        self,
+        result_text: str,
+        config: dict,
+        legacy_parse: bool = True,
+    ) -> CVAnalysis:
+        """
+        Parse a raw model response into a validated CVAnalysis.
+
+        Fast path: with structured outputs the response is exactly
+        CVAnalysisRaw, so one model_validate_json replaces all of the
+        fence-stripping / regex-salvage / key-alias machinery. Responses
+        that deviate from the schema fall back to the legacy parser unless
+        legacy_parse is False.
+        """
+        try:
+            raw = CVAnalysisRaw.model_validate_json(result_text)
+        except ValidationError:
+            if not legacy_parse:
+                raise GroqAPIError(
+                    "Model response did not match the analysis schema. "
+                    f"Current model: {config['model']}"
+                )
+            logger.debug("Response is not strict CVAnalysisRaw JSON, using legacy parser")
+            return self._parse_analysis_response_legacy(result_text, config)
+
+        # Structured outputs still produce placeholder entries like
+        # "Not specified"; normalization strips them on this path too.
+        strengths = _normalize_skill_list(raw.matching_skills)
+        missing_skills = _normalize_skill_list(raw.missing_skills)
+
+        if (
+            raw.overall_score == 0
+            and raw.skills_match == 0
+            and raw.experience_match == 0
+            and raw.education_match == 0
+            and not strengths
+            and not missing_skills
+        ):
+            logger.error("Model returned structurally valid but COMPLETELY EMPTY analysis.")
+            raise GroqAPIError(
+                "The AI returned an empty analysis. "
+                "Please try again or slightly shorten your CV / job description."
+            )
+
+        return CVAnalysis(
+            overall_score=raw.overall_score,
+            skills_match=raw.skills_match,
+            experience_match=raw.experience_match,
+            education_match=raw.education_match,
+            strengths=strengths,
+            missing_skills=missing_skills,
+            gaps_analysis=raw.skill_gap_analysis_summary,
+            youtube_search_query=raw.youtube_search_query,
+        )
+
+    def _parse_analysis_response_legacy(self, result_text: str, config: dict) -> CVAnalysis:
+        """
+        Defensive parser for responses that deviate from the schema.
+
+        Strips code fences, salvages JSON when the model wraps it in prose,
+        maps the model's key variations onto our schema and normalizes the
+        skill lists.
+        """
+        # Parse JSON response
+        try:
+            clean_text = result_text.strip()
+            clean_text = clean_text.removeprefix("```json").removeprefix("```")
+            clean_text = clean_text.removesuffix("```").strip()
+
+            analysis_data = _json_loads(clean_text)
+            logger.debug("Successfully parsed JSON response")
+
+        except ValueError as e:
+            logger.error(f"JSON decode error: {str(e)}")
+            logger.error(f"Response text (first 500 chars): {result_text[:500]}")
+
+            # Try to find JSON in the response
+            json_match = _JSON_EXTRACT_RE.search(result_text)
+            if json_match:
+                try:
+                    analysis_data = _json_loads(json_match.group(0))
+                    logger.info("Successfully extracted JSON using regex")
+                except Exception:
+                    raise GroqAPIError(
+                        "Model returned invalid JSON even after extraction. "
+                        "Try again, or slightly shorten your CV / job description."
+                    )
+            else:
+                raise GroqAPIError(
+                    "Model did not return JSON format. "
+                    f"Current model: {config['model']}"
+                )
+
+        # Log what we received to debug; the pretty-printed dump only gets
+        # serialized when a DEBUG sink is actually listening
+        logger.debug(f"Received JSON keys: {list(analysis_data.keys())}")
+        logger.opt(lazy=True).debug(
+            "Full JSON response: {}", lambda: _json_pretty(analysis_data)
+        )
+
+        # Convert to our CVAnalysis model
+        try:
+            # Extract values with all possible key variations: one lowercased
+            # view of the response plus an alias table replaces the old
+            # per-field or-chains of .get() calls.
+            lowered = {str(k).strip().lower(): v for k, v in analysis_data.items()}
+
+            def pick(field, default):
+                for alias in _KEY_ALIASES[field]:
+                    value = lowered.get(alias)
+                    if value:
+                        return value
+                return default
+
+            overall = pick("overall", 0)
+            skills = pick("skills", 0)
+            experience = pick("experience", 0)
+            education = pick("education", 0)
+            strengths = pick("strengths", [])
+            missing = pick("missing", [])
+            summary = pick("summary", "")
+            query = pick("query", "")
+
+            logger.info(
+                f"Extracted values - Overall: {overall}, Skills: {skills}, "
+                f"Exp: {experience}, Edu: {education}"
+            )
+            logger.info(
+                f"Strengths count (raw): {len(strengths)}, Missing count (raw): {len(missing)}"
+            )
+
+            # 🔹 Normalize both skill fields to list[str]
+            strengths_norm = _normalize_skill_list(strengths)
+            missing_norm = _normalize_skill_list(missing)
+
+            logger.info(
+                f"Normalized strengths: {strengths_norm}, "
+                f"Normalized missing_skills: {missing_norm}"
+            )
+
+            # --- Sanity check: detect completely empty / useless analysis ---
+            all_zero_scores = (
+                int(overall) == 0
+                and int(skills) == 0
+                and int(experience) == 0
+                and int(education) == 0
+            )
+
+            no_real_strengths = _is_truly_empty_list(strengths_norm)
+            no_real_missing = _is_truly_empty_list(missing_norm)
+            empty_summary = not summary or not summary.strip()
+            empty_query = not query or not query.strip()
+
+            if (
+                all_zero_scores
+                and no_real_strengths
+                and no_real_missing
+                and empty_summary
+                and empty_query
+            ):
+                logger.error("Model returned structurally valid but COMPLETELY EMPTY analysis.")
+                raise GroqAPIError(
+                    "The AI returned an empty analysis. "
+                    "Please try again or slightly shorten your CV / job description."
+                )
+
+            converted_data = {
+                "overall_score": int(overall),
+                "skills_match": int(skills),
+                "experience_match": int(experience),
+                "education_match": int(education),
+                "strengths": strengths_norm,
+                "missing_skills": missing_norm,
+                "gaps_analysis": (
+                    summary.strip()
+                    if summary and summary.strip()
+                    else "Analysis not available. Please review the strengths and missing skills above."
+                ),
+                "youtube_search_query": query if query else "skill improvement tutorial",
+            }
+
+            # Log what we're trying to create
+            logger.debug(f"Converted data: {converted_data}")
+
+            # Validate using Pydantic model
+            analysis = CVAnalysis(**converted_data)
+
+            logger.info("✅ Analysis complete!")
+            logger.info(f"Overall: {analysis.overall_score}/100")
+            logger.info(
+                f"Skills: {analysis.skills_match}/100, "
+                f"Experience: {analysis.experience_match}/100, "
+                f"Education: {analysis.education_match}/100"
+            )
+
+            return analysis
+
+        except Exception as e:
+            logger.error(f"Error converting response to CVAnalysis: {str(e)}")
+            logger.error(f"Response data: {analysis_data}")
+            raise GroqAPIError(f"Failed to parse API response into valid format: {str(e)}")
+
+    def analyze_cv(
+        self,
+        cv_text: str,
+        job_description: str,
+        on_token: Optional[Callable[[str], None]] = None,
+        use_cache: bool = True,
+    ) -> CVAnalysis:
+        """
+        Analyze CV against job description using Groq API.
+
+        Args:
+            cv_text: Candidate's CV text
+            job_description: Job description text
+            on_token: Optional callback invoked with each streamed text delta,
+                so callers can surface progress while the model generates
+            use_cache: Reuse a previous result for an identical CV/JD pair
+                (same model and temperature) instead of calling the API again
+
+        Returns:
+            CVAnalysis: Analysis results
+
+        Raises:
+            GroqAPIError: If API call fails
+        """
+        # Get model configuration from .env
+        config = self._get_model_config()
+
+        cache_key = None
+        if use_cache:
+            cache_key = _analysis_cache_key(cv_text, job_description, config)
+            cached = _ANALYSIS_CACHE.get(cache_key)
+            if cached is not None:
+                _ANALYSIS_CACHE.move_to_end(cache_key)
+                logger.info("Analysis cache hit - skipping Groq API call")
+                return CVAnalysis.model_validate(cached)
+
+        try:
+            # Build prompt
+            prompt = self._build_analysis_prompt(cv_text, job_description)
+
+            # Log configuration being used
+            logger.info(f"Using model: {config['model']}")
+            logger.info(f"Temperature: {config['temperature']}, Max tokens: {config['max_tokens']}")
+
+            # Make API request using official SDK
+            logger.info("Sending request to Groq API...")
+            logger.info(f"Prompt length: {len(prompt)} characters")
+            logger.opt(lazy=True).debug("Prompt preview: {}...", lambda: prompt[:300])
+
+            # Retry transient failures (rate limits, 5xx, dropped connections)
+            # with exponential backoff and jitter; other errors raise at once.
+            for attempt in range(_MAX_ATTEMPTS):
+                try:
+                    stream = self.client.chat.completions.create(
+                        model=config["model"],
+                        messages=self._build_messages(prompt),
+                        temperature=config["temperature"],
+                        max_completion_tokens=config["max_tokens"],
+                        stream=True,
+                    )
+
+                    # Accumulate streamed deltas and stop as soon as a complete
+                    # JSON object has arrived - trailing prose is ignored.
+                    result_text = self._collect_stream(stream, on_token)
+                    break
+                except _TRANSIENT_ERRORS as e:
+                    if attempt == _MAX_ATTEMPTS - 1:
+                        raise
+                    delay = 0.5 * (2 ** attempt) + random.uniform(0, 0.25)
+                    logger.warning(
+                        f"Transient Groq error ({type(e).__name__}), "
+                        f"retrying in {delay:.1f}s (attempt {attempt + 1}/{_MAX_ATTEMPTS})"
+                    )
+                    time.sleep(delay)
+            logger.info(f"Received response, length: {len(result_text)} characters")
+            logger.opt(lazy=True).debug(
+                "Raw API response (first 300 chars): {}", lambda: result_text[:300]
+            )
+
+            analysis = self._parse_analysis_response(result_text, config)
+
+            if cache_key is not None:
+                _ANALYSIS_CACHE[cache_key] = analysis.model_dump()
+                if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_MAX:
+                    _ANALYSIS_CACHE.popitem(last=False)
+
+            return analysis
+
+        except GroqAPIError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in analyze_cv: {str(e)}")
+            logger.exception("Full traceback:")
+
+            error_msg = str(e).lower()
+            if "authentication" in error_msg or "api key" in error_msg or "401" in error_msg:
+                raise GroqAPIError("Invalid API key. Please check your GROQ_API_KEY in .env file.")
+            elif "rate limit" in error_msg or "429" in error_msg:
+                raise GroqAPIError("Rate limit exceeded. Please wait a moment and try again.")
+            elif "timeout" in error_msg:
+                raise GroqAPIError("Request timed out. Please try again.")
+            elif "model" in error_msg and "not found" in error_msg:
+                raise GroqAPIError(
+                    f"Model not found. Check GROQ_MODEL in .env file. Current: {self._get_model_config()['model']}"
+                )
+            else:
+                raise GroqAPIError(f"Analysis failed: {str(e)}")
+
+    def analyze_cv_batch(self, pairs: List[Tuple[str, str]]) -> List[CVAnalysis]:
+        """
+        Analyze several (cv_text, job_description) pairs concurrently.
+
+        Each pair still costs one model invocation, but the requests run
+        in parallel against Groq (capped by GROQ_CONCURRENCY), so N pairs
+        finish in roughly the time of one instead of N sequential calls.
+
+        Args:
+            pairs: List of (cv_text, job_description) tuples
+
+        Returns:
+            List[CVAnalysis]: One analysis per pair, in input order
+
+        Raises:
+            GroqAPIError: If any API call or response parse fails
+        """
+        if not pairs:
+            return []
+
+        config = self._get_model_config()
+        concurrency = getattr(self.settings, "groq_concurrency", 8) if self.settings else 8
+
+        async def _analyze_one(client, semaphore, cv_text, job_description):
+            prompt = self._build_analysis_prompt(cv_text, job_description)
+            async with semaphore:
+                response = await client.chat.completions.create(
+                    model=config["model"],
+                    messages=self._build_messages(prompt),
+                    temperature=config["temperature"],
+                    max_completion_tokens=config["max_tokens"],
+                    # Groq enforces the schema server-side in non-streaming mode
+                    response_format=self._response_format(),
+                )
+            result_text = response.choices[0].message.content or ""
+            return self._parse_analysis_response(result_text, config)
+
+        async def _run():
+            client = AsyncGroq(api_key=self.api_key)
+            semaphore = asyncio.Semaphore(concurrency)
+            try:
+                return await asyncio.gather(*[
+                    _analyze_one(client, semaphore, cv_text, job_description)
+                    for cv_text, job_description in pairs
+                ])
+            finally:
+                await client.close()
+
+        logger.info(f"Analyzing batch of {len(pairs)} CV/JD pairs (concurrency {concurrency})")
+        try:
+            return list(asyncio.run(_run()))
+        except GroqAPIError:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error in analyze_cv_batch: {str(e)}")
+            raise GroqAPIError(f"Batch analysis failed: {str(e)}")
+
+    def test_connection(self) -> bool:
+        """
+        Test connection to Groq API.
+
+        Returns:
+            bool: True if connection successful
+        """
+        try:
+            config = self._get_model_config()
+            self.client.chat.completions.create(
+                model=config["model"],
+                messages=[{"role": "user", "content": "test"}],
+                max_completion_tokens=10,
+            )
+            logger.debug(f"Connection test successful with model: {config['model']}")
+            return True
+        except Exception as e:
+            logger.error(f"Connection test failed: {str(e)}")
+            return False
@@ -2,19 +2,60 @@
 Serper API service for YouTube video search.
 """
 
+import asyncio
+import re
+import time
+from functools import lru_cache
+
+import httpx
 import requests
-from typing import List, Optional
+from pydantic import TypeAdapter, ValidationError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Tuple
 from loguru import logger
 
-from cv_analyser.models.schemas import YouTubeVideo
+from cv_analyser.models.schemas import YouTubeVideo, _YT_LINK_RE
 from cv_analyser.config import get_settings
 
+# Video-ID extraction for both URL shapes in one compiled alternation
+_YT_ID_RE = re.compile(r"(?:youtube\.com/watch\?v=|youtu\.be/)([^&?/\s]+)")
+
+# One pydantic-core call validates a whole result list; built once at import
+_VIDEOS_ADAPTER = TypeAdapter(List[YouTubeVideo])
+
+
+@lru_cache(maxsize=1024)
+def _parse_youtube_url(video_url: str) -> Optional[str]:
+    """Extract the video ID from a YouTube URL; memoized per distinct URL."""
+    match = _YT_ID_RE.search(video_url)
+    return match.group(1) if match else None
+
+# orjson parses several times faster than stdlib json; optional dependency
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class SerperAPIError(Exception):
     """Custom exception for Serper API errors."""
     pass
 
 
+def _decode_response(response):
+    """Decode a Serper response body with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# YouTube search results are stable enough to reuse for a day, so cache them
+# by (query, num_results) and skip the Serper round-trip on repeat searches.
+_SEARCH_CACHE: Dict[Tuple[str, int], Tuple[float, List[YouTubeVideo]]] = {}
+_SEARCH_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
 class SerperService:
     """Service for interacting with Serper API."""
     
@@ -28,9 +69,29 @@ class SerperService:
         self.settings = get_settings()
         self.api_key = api_key or self.settings.serper_api_key
         self.base_url = "https://google.serper.dev/videos"
-        
+        self._default_num_results = self.settings.serper_num_results
+
         if not self.api_key:
             raise ValueError("Serper API key not provided")
+
+        # One pooled session per instance: connection reuse skips the
+        # TCP+TLS handshake on every call, and transient 429/5xx answers
+        # retry with backoff at the transport layer.
+        retry = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"],
+        )
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry),
+        )
+        self._session.headers.update({
+            "X-API-KEY": self.api_key,
+            "Content-Type": "application/json",
+        })
     
     def search_youtube_videos(
         self, 
@@ -52,19 +113,24 @@ class SerperService:
         """
         if not query or not query.strip():
             raise ValueError("Search query cannot be empty")
-        
-        num_results = num_results or self.settings.serper_num_results
-        
+
+        num_results = num_results or self._default_num_results
+
+        cache_key = (query, num_results)
+        cached = _SEARCH_CACHE.get(cache_key)
+        if cached is not None:
+            cached_at, videos = cached
+            if time.monotonic() - cached_at < _SEARCH_CACHE_TTL:
+                logger.info(f"Search cache hit for: {query}")
+                return list(videos)
+            del _SEARCH_CACHE[cache_key]
+
         try:
             logger.info(f"Searching YouTube for: {query}")
             
             # Make API request
-            response = requests.post(
+            response = self._session.post(
                 self.base_url,
-                headers={
-                    "X-API-KEY": self.api_key,
-                    "Content-Type": "application/json"
-                },
                 json={
                     "q": query,
                     "num": num_results
@@ -85,30 +151,10 @@ class SerperService:
                 raise SerperAPIError(error_msg)
             
             # Parse response
-            results = response.json()
-            videos = []
-            
-            if 'videos' not in results:
-                logger.warning("No videos found in API response")
-                return videos
-            
-            # Extract video information
-            for video_data in results['videos'][:num_results]:
-                try:
-                    video = YouTubeVideo(
-                        title=video_data.get('title', 'N/A'),
-                        link=video_data.get('link', '#'),
-                        channel=video_data.get('channel', 'N/A'),
-                        duration=video_data.get('duration', 'N/A'),
-                        thumbnail=video_data.get('imageUrl')
-                    )
-                    videos.append(video)
-                    logger.debug(f"Added video: {video.title}")
-                except Exception as e:
-                    logger.warning(f"Failed to parse video data: {str(e)}")
-                    continue
-            
+            results = _decode_response(response)
+            videos = self._parse_videos(results, num_results)
             logger.info(f"Found {len(videos)} videos")
+            _SEARCH_CACHE[cache_key] = (time.monotonic(), list(videos))
             return videos
             
         except requests.exceptions.Timeout:
@@ -121,6 +167,221 @@ class SerperService:
             logger.error(f"Unexpected error in search_youtube_videos: {str(e)}")
             raise SerperAPIError(f"Search failed: {str(e)}")
     
+    @staticmethod
+    def _parse_videos(results: dict, num_results: int) -> List[YouTubeVideo]:
+        """Extract YouTubeVideo objects from one Serper result payload."""
+        if 'videos' not in results:
+            logger.warning("No videos found in API response")
+            return []
+
+        entries = []
+        for video_data in results['videos'][:num_results]:
+            get = video_data.get
+            entries.append({
+                'title': get('title', 'N/A'),
+                'link': get('link', '#'),
+                'channel': get('channel', 'N/A'),
+                'duration': get('duration', 'N/A'),
+                'thumbnail': get('imageUrl'),
+            })
+
+        # Fast path: one pydantic-core call validates the whole batch.
+        # Any bad entry (typically a non-YouTube link) fails the batch, and
+        # the tolerant per-item loop below keeps the valid ones.
+        try:
+            return _VIDEOS_ADAPTER.validate_python(entries)
+        except ValidationError:
+            logger.debug("Batch video validation failed, validating per item")
+
+        videos = []
+        for entry in entries:
+            try:
+                videos.append(YouTubeVideo(**entry))
+                logger.debug(f"Added video: {entry['title']}")
+            except ValidationError:
+                logger.warning(f"Skipping invalid video entry: {entry['link']}")
+                continue
+
+        return videos
+
+    async def search_youtube_videos_async(
+        self,
+        query: str,
+        num_results: Optional[int] = None
+    ) -> List[YouTubeVideo]:
+        """
+        Async variant of search_youtube_videos for use inside event loops.
+
+        Built on httpx (already present as a Groq SDK dependency) so several
+        searches can run concurrently without spawning threads.
+
+        Args:
+            query: Search query
+            num_results: Number of results to return (default from settings)
+
+        Returns:
+            List[YouTubeVideo]: List of YouTube videos
+
+        Raises:
+            SerperAPIError: If API call fails
+        """
+        if not query or not query.strip():
+            raise ValueError("Search query cannot be empty")
+
+        num_results = num_results or self._default_num_results
+
+        cache_key = (query, num_results)
+        cached = _SEARCH_CACHE.get(cache_key)
+        if cached is not None:
+            cached_at, videos = cached
+            if time.monotonic() - cached_at < _SEARCH_CACHE_TTL:
+                logger.info(f"Search cache hit for: {query}")
+                return list(videos)
+            del _SEARCH_CACHE[cache_key]
+
+        try:
+            logger.info(f"Searching YouTube (async) for: {query}")
+
+            async with httpx.AsyncClient(
+                headers={
+                    "X-API-KEY": self.api_key,
+                    "Content-Type": "application/json"
+                },
+                timeout=15,
+            ) as client:
+                response = await client.post(
+                    self.base_url,
+                    json={
+                        "q": query,
+                        "num": num_results
+                    },
+                )
+
+            if response.status_code != 200:
+                error_msg = f"Serper API error: {response.status_code}"
+                try:
+                    error_data = response.json()
+                    error_msg += f" - {error_data.get('message', 'Unknown error')}"
+                except:
+                    error_msg += f" - {response.text[:200]}"
+
+                logger.error(error_msg)
+                raise SerperAPIError(error_msg)
+
+            results = _decode_response(response)
+            videos = self._parse_videos(results, num_results)
+            logger.info(f"Found {len(videos)} videos")
+            _SEARCH_CACHE[cache_key] = (time.monotonic(), list(videos))
+            return videos
+
+        except httpx.TimeoutException:
+            raise SerperAPIError("Request timed out. Please try again.")
+        except httpx.HTTPError as e:
+            raise SerperAPIError(f"Network error: {str(e)}")
+        except Exception as e:
+            if isinstance(e, SerperAPIError):
+                raise
+            logger.error(f"Unexpected error in search_youtube_videos_async: {str(e)}")
+            raise SerperAPIError(f"Search failed: {str(e)}")
+
+    async def search_many(
+        self,
+        queries: List[str],
+        num_results: Optional[int] = None
+    ) -> Dict[str, List[YouTubeVideo]]:
+        """
+        Run several searches concurrently in one event loop.
+
+        Each query still goes through search_youtube_videos_async (and so
+        through the shared cache), but the requests overlap instead of
+        paying one round-trip after another.
+
+        Args:
+            queries: Search queries (blank entries are dropped)
+            num_results: Number of results per query (default from settings)
+
+        Returns:
+            Dict[str, List[YouTubeVideo]]: Mapping of query -> videos
+
+        Raises:
+            SerperAPIError: If any of the searches fails
+        """
+        queries = [q for q in queries if q and q.strip()]
+        if not queries:
+            raise ValueError("Search queries cannot be empty")
+
+        results = await asyncio.gather(
+            *(self.search_youtube_videos_async(query, num_results) for query in queries)
+        )
+        return dict(zip(queries, results))
+
+    def search_youtube_videos_batch(
+        self,
+        queries: List[str],
+        num_results: Optional[int] = None
+    ) -> dict:
+        """
+        Search several queries in a single Serper request.
+
+        Serper accepts a JSON array of query objects and answers with one
+        result object per query, so N skills cost one round-trip instead of N.
+
+        Args:
+            queries: Search queries (order is preserved in the response)
+            num_results: Number of results per query (default from settings)
+
+        Returns:
+            dict: Mapping of query -> List[YouTubeVideo]
+
+        Raises:
+            SerperAPIError: If the batched API call fails
+        """
+        queries = [q for q in queries if q and q.strip()]
+        if not queries:
+            raise ValueError("Search queries cannot be empty")
+
+        num_results = num_results or self._default_num_results
+
+        try:
+            logger.info(f"Batch searching YouTube for {len(queries)} queries")
+
+            response = self._session.post(
+                self.base_url,
+                json=[{"q": query, "num": num_results} for query in queries],
+                timeout=30
+            )
+
+            if response.status_code != 200:
+                error_msg = f"Serper API error: {response.status_code}"
+                try:
+                    error_data = response.json()
+                    error_msg += f" - {error_data.get('message', 'Unknown error')}"
+                except:
+                    error_msg += f" - {response.text[:200]}"
+
+                logger.error(error_msg)
+                raise SerperAPIError(error_msg)
+
+            results = _decode_response(response)
+            if isinstance(results, dict):
+                # Single-query payloads come back as one object, not a list
+                results = [results]
+
+            return {
+                query: self._parse_videos(result, num_results)
+                for query, result in zip(queries, results)
+            }
+
+        except requests.exceptions.Timeout:
+            raise SerperAPIError("Request timed out. Please try again.")
+        except requests.exceptions.RequestException as e:
+            raise SerperAPIError(f"Network error: {str(e)}")
+        except Exception as e:
+            if isinstance(e, SerperAPIError):
+                raise
+            logger.error(f"Unexpected error in search_youtube_videos_batch: {str(e)}")
+            raise SerperAPIError(f"Batch search failed: {str(e)}")
+
     def test_connection(self) -> bool:
         """
         Test connection to Serper API.
@@ -129,12 +390,8 @@ class SerperService:
             bool: True if connection successful
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.base_url,
-                headers={
-                    "X-API-KEY": self.api_key,
-                    "Content-Type": "application/json"
-                },
                 json={
                     "q": "test",
                     "num": 1
@@ -157,13 +414,9 @@ class SerperService:
         Returns:
             dict: Video details (basic info only)
         """
-        # Extract video ID from URL
-        video_id = None
-        if 'youtube.com/watch?v=' in video_url:
-            video_id = video_url.split('watch?v=')[1].split('&')[0]
-        elif 'youtu.be/' in video_url:
-            video_id = video_url.split('youtu.be/')[1].split('?')[0]
-        
+        # Extract video ID from URL; recurring URLs hit the LRU cache
+        video_id = _parse_youtube_url(video_url)
+
         if video_id:
             return {
                 'video_id': video_id,
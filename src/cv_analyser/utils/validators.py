@@ -2,18 +2,108 @@
 Validation utilities for input data.
 """
 
+import re
+from dataclasses import dataclass
 from typing import Optional, Tuple
 from loguru import logger
 
+# Keyword probes as frozensets: the text is tokenized once and counting
+# becomes a hash-set intersection instead of one scan per keyword.
+_TOKEN_RE = re.compile(r"[a-z]+")
+_CV_KEYWORDS = frozenset({
+    'experience', 'education', 'skills', 'work', 'university',
+    'degree', 'job', 'position', 'project', 'achievement',
+})
+_JD_KEYWORDS = frozenset({
+    'requirements', 'responsibilities', 'qualifications', 'experience',
+    'skills', 'required', 'preferred',
+})
+# Two-word JD phrases checked against adjacent token pairs
+_JD_KEYWORD_BIGRAMS = frozenset({('must', 'have'), ('looking', 'for')})
+
+# Any run of whitespace, collapsed in one linear pass during sanitization
+_WS_RUN_RE = re.compile(r"\s+")
+
+# Placeholder API-key values, scanned in one case-insensitive pass instead
+# of lowercasing the key and probing each substring separately
+_PLACEHOLDER_RE = re.compile(r"your_api_key|api_key_here|xxx|test", re.IGNORECASE)
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
 
 
+@dataclass(frozen=True)
+class TextAnalysis:
+    """
+    Single-pass summary of one text input (built by Validators.analyze).
+
+    Callers read the precomputed fields instead of re-scanning the text
+    through the individual validators.
+    """
+
+    length: int
+    cv_keyword_count: int
+    jd_keyword_count: int
+
+    def length_error(self, min_length: int = 50, max_length: int = 50000) -> Optional[str]:
+        """Length-validation message, or None when the length is acceptable."""
+        if self.length == 0:
+            return "Text cannot be empty"
+        if self.length < min_length:
+            return f"Text too short (minimum {min_length} characters, got {self.length})"
+        if self.length > max_length:
+            return f"Text too long (maximum {max_length} characters, got {self.length})"
+        return None
+
+    @property
+    def cv_warning(self) -> Optional[str]:
+        """Warning when the text does not look like a typical CV."""
+        if self.cv_keyword_count < 2:
+            return "Warning: This doesn't look like a typical CV. Results may be inaccurate."
+        return None
+
+    @property
+    def jd_warning(self) -> Optional[str]:
+        """Warning when the text does not look like a typical job description."""
+        if self.jd_keyword_count < 2:
+            return "Warning: This doesn't look like a typical job description. Results may be inaccurate."
+        return None
+
+
 class Validators:
     """Collection of validation methods."""
-    
+
+    @staticmethod
+    def analyze(text: str) -> TextAnalysis:
+        """
+        Summarize a text input in a single pass.
+
+        Computes everything validate_text_length, validate_cv_content and
+        validate_job_description would extract separately - length plus the
+        CV and JD keyword counts - while lowercasing and tokenizing the
+        text only once.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            TextAnalysis: Precomputed length and keyword counts
+        """
+        stripped = text.strip() if text else ""
+        tokens = _TOKEN_RE.findall(stripped.lower())
+        token_set = frozenset(tokens)
+
+        jd_count = len(token_set & _JD_KEYWORDS)
+        jd_count += len(set(zip(tokens, tokens[1:])) & _JD_KEYWORD_BIGRAMS)
+
+        return TextAnalysis(
+            length=len(stripped),
+            cv_keyword_count=len(token_set & _CV_KEYWORDS),
+            jd_keyword_count=jd_count,
+        )
+
     @staticmethod
     def validate_text_length(text: str, min_length: int = 50, max_length: int = 50000) -> Tuple[bool, Optional[str]]:
         """
@@ -27,11 +117,13 @@ class Validators:
         Returns:
             Tuple[bool, Optional[str]]: (is_valid, error_message)
         """
-        if not text or not text.strip():
+        # Strip once; the empty check and the length both use the same copy
+        stripped = text.strip() if text else ""
+        if not stripped:
             return False, "Text cannot be empty"
-        
-        text_len = len(text.strip())
-        
+
+        text_len = len(stripped)
+
         if text_len < min_length:
             return False, f"Text too short (minimum {min_length} characters, got {text_len})"
         
@@ -60,8 +152,7 @@ class Validators:
             return False, f"{key_name} appears too short"
         
         # Check for placeholder values
-        placeholder_values = ['your_api_key', 'api_key_here', 'xxx', 'test']
-        if any(placeholder in api_key.lower() for placeholder in placeholder_values):
+        if _PLACEHOLDER_RE.search(api_key):
             return False, f"{key_name} appears to be a placeholder"
         
         return True, None
@@ -100,16 +191,10 @@ class Validators:
         Returns:
             Tuple[bool, Optional[str]]: (is_valid, warning_message)
         """
-        text_lower = text.lower()
-        
-        # Common CV indicators
-        cv_keywords = [
-            'experience', 'education', 'skills', 'work', 'university',
-            'degree', 'job', 'position', 'project', 'achievement'
-        ]
-        
-        keyword_count = sum(1 for keyword in cv_keywords if keyword in text_lower)
-        
+        # Tokenize once, then count distinct CV indicators by intersection
+        tokens = frozenset(_TOKEN_RE.findall(text.lower()))
+        keyword_count = len(tokens & _CV_KEYWORDS)
+
         if keyword_count < 2:
             return True, "Warning: This doesn't look like a typical CV. Results may be inaccurate."
         
@@ -126,16 +211,12 @@ class Validators:
         Returns:
             Tuple[bool, Optional[str]]: (is_valid, warning_message)
         """
-        text_lower = text.lower()
-        
-        # Common job description indicators
-        jd_keywords = [
-            'requirements', 'responsibilities', 'qualifications', 'experience',
-            'skills', 'required', 'preferred', 'must have', 'looking for'
-        ]
-        
-        keyword_count = sum(1 for keyword in jd_keywords if keyword in text_lower)
-        
+        # Tokenize once, then count distinct JD indicators by intersection;
+        # two-word phrases are matched against adjacent token pairs
+        tokens = _TOKEN_RE.findall(text.lower())
+        keyword_count = len(frozenset(tokens) & _JD_KEYWORDS)
+        keyword_count += len(set(zip(tokens, tokens[1:])) & _JD_KEYWORD_BIGRAMS)
+
         if keyword_count < 2:
             return True, "Warning: This doesn't look like a typical job description. Results may be inaccurate."
         
@@ -152,14 +233,11 @@ class Validators:
         Returns:
             str: Sanitized text
         """
-        # Remove excessive whitespace
-        text = ' '.join(text.split())
-        
+        # Collapse whitespace runs in a single C-level pass; the old
+        # join(split()) built an intermediate list of every word
+        text = _WS_RUN_RE.sub(' ', text)
+
         # Remove null bytes
         text = text.replace('\x00', '')
-        
-        # Limit consecutive newlines
-        while '\n\n\n' in text:
-            text = text.replace('\n\n\n', '\n\n')
-        
+
         return text.strip()
\ No newline at end of file
@@ -2,10 +2,38 @@
 Pytest configuration and shared fixtures.
 """
 
+import json
 import pytest
 import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@pytest.fixture
+def fast_json(monkeypatch):
+    """
+    Opt-in fixture that swaps stdlib json.loads/json.dumps for orjson.
+
+    Lets the Groq service tests exercise response parsing with the same
+    fast decoder the production code prefers. No-op when orjson is absent.
+    """
+    if orjson is None:
+        yield
+        return
+
+    def dumps(obj, **kwargs):
+        # orjson returns bytes and takes no stdlib kwargs; keep the
+        # str-returning contract callers of json.dumps expect.
+        return orjson.dumps(obj).decode()
+
+    monkeypatch.setattr(json, 'loads', orjson.loads)
+    monkeypatch.setattr(json, 'dumps', dumps)
+    yield
+
 
 @pytest.fixture
 def sample_cv_text():
@@ -0,0 +1,24 @@
+"""
+Tests for Streamlit app helpers.
+"""
+
+import base64
+import pytest
+from pathlib import Path
+
+# Importing the app module runs its page setup in Streamlit "bare mode",
+# which only logs warnings; the cached helpers stay directly callable.
+from cv_analyser.app import _extract_cv_text
+
+_SAMPLE_PDF_B64 = Path(__file__).parent / "fixtures" / "sample_cv.pdf.b64"
+
+
+@pytest.mark.slow
+def test_extract_cv_text_wiring():
+    """Test that the upload helper drives the parser end to end."""
+    pdf_bytes = base64.b64decode(_SAMPLE_PDF_B64.read_bytes())
+
+    text = _extract_cv_text(pdf_bytes)
+
+    assert "John Doe" in text
+    assert "Python" in text
@@ -1,303 +1,205 @@
-"""
-Tests for Groq API service.
-"""
-
-import pytest
-import json
-from unittest.mock import Mock, patch, MagicMock
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from CV_analyser.services.groq_service import GroqService, GroqAPIError
-from CV_analyser.models.schemas import CVAnalysis
-
-
-class TestGroqService:
-    """Test cases for GroqService class."""
-    
-    @pytest.fixture
-    def groq_service(self):
-        """Create GroqService instance for testing."""
-        return GroqService(api_key="test_groq_key_12345")
-    
-    @pytest.fixture
-    def mock_successful_response(self):
-        """Mock successful Groq API response."""
-        return {
-            "choices": [
-                {
-                    "message": {
-                        "content": json.dumps({
-                            "overall_score": 75,
-                            "strengths": [
-                                "Strong Python programming skills",
-                                "Experience with Docker and Kubernetes",
-                                "AWS cloud deployment knowledge"
-                            ],
-                            "missing_skills": [
-                                "GraphQL API experience",
-                                "Go or Rust programming",
-                                "Machine learning background"
-                            ],
-                            "gaps_analysis": "The candidate demonstrates solid backend development skills with strong Python experience and DevOps capabilities. However, there are notable gaps in modern API technologies like GraphQL and additional programming languages that would strengthen the application.",
-                            "youtube_search_query": "GraphQL tutorial Python backend development"
-                        })
-                    }
-                }
-            ]
-        }
-    
-    def test_initialization_with_api_key(self):
-        """Test service initialization with API key."""
-        service = GroqService(api_key="test_key")
-        assert service.api_key == "test_key"
-        assert service.base_url == "https://api.groq.com/openai/v1/chat/completions"
-    
-    def test_initialization_without_api_key_raises_error(self):
-        """Test that initialization without API key raises ValueError."""
-        with patch('cv_analyzer.services.groq_service.get_settings') as mock_settings:
-            mock_settings.return_value.groq_api_key = None
-            with pytest.raises(ValueError, match="Groq API key not provided"):
-                GroqService()
-    
-    def test_build_analysis_prompt(self, groq_service, sample_cv_text, sample_job_description):
-        """Test prompt building."""
-        prompt = groq_service._build_analysis_prompt(sample_cv_text, sample_job_description)
-        
-        assert "CV:" in prompt
-        assert "Job Description:" in prompt
-        assert sample_cv_text in prompt
-        assert sample_job_description in prompt
-        assert "JSON format" in prompt
-        assert "overall_score" in prompt
-    
-    def test_extract_json_from_response_plain_json(self, groq_service):
-        """Test JSON extraction from plain JSON response."""
-        content = '{"overall_score": 75, "strengths": ["Python"], "missing_skills": ["Go"], "gaps_analysis": "Test", "youtube_search_query": "test"}'
-        result = groq_service._extract_json_from_response(content)
-        
-        assert result["overall_score"] == 75
-        assert "Python" in result["strengths"]
-    
-    def test_extract_json_from_response_with_markdown(self, groq_service):
-        """Test JSON extraction from markdown code blocks."""
-        content = '```json\n{"overall_score": 80, "strengths": ["Python"], "missing_skills": ["Go"], "gaps_analysis": "Test", "youtube_search_query": "test"}\n```'
-        result = groq_service._extract_json_from_response(content)
-        
-        assert result["overall_score"] == 80
-    
-    def test_extract_json_from_response_invalid_json(self, groq_service):
-        """Test JSON extraction with invalid JSON."""
-        content = "This is not valid JSON"
-        
-        with pytest.raises(GroqAPIError, match="Invalid JSON response"):
-            groq_service._extract_json_from_response(content)
-    
-    @patch('cv_analyzer.services.groq_service.requests.post')
-    def test_analyze_cv_success(
-        self, 
-        mock_post, 
-        groq_service, 
-        sample_cv_text, 
-        sample_job_description, 
-        mock_successful_response
-    ):
-        """Test successful CV analysis."""
-        # Setup mock
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_successful_response
-        mock_post.return_value = mock_response
-        
-        # Execute
-        result = groq_service.analyze_cv(sample_cv_text, sample_job_description)
-        
-        # Verify
-        assert isinstance(result, CVAnalysis)
-        assert result.overall_score == 75
-        assert len(result.strengths) == 3
-        assert len(result.missing_skills) == 3
-        assert "Python" in result.strengths[0]
-        assert result.youtube_search_query == "GraphQL tutorial Python backend development"
-        
-        # Verify API call
-        mock_post.assert_called_once()
-        call_args = mock_post.call_args
-        assert "Bearer test_groq_key_12345" in call_args[1]["headers"]["Authorization"]
-    
-    @patch('cv_analyzer.services.groq_service.requests.post')
-    def test_analyze_cv_api_error(
-        self, 
-        mock_post, 
-        groq_service, 
-        sample_cv_text, 
-        sample_job_description
-    ):
-        """Test CV analysis with API error."""
-        # Setup mock
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.json.return_value = {
-            "error": {"message": "Invalid API key"}
-        }
-        mock_response.text = "Unauthorized"
-        mock_post.return_value = mock_response
-        
-        # Execute and verify
-        with pytest.raises(GroqAPIError, match="Groq API error: 401"):
-            groq_service.analyze_cv(sample_cv_text, sample_job_description)
-    
-    @patch('cv_analyzer.services.groq_service.requests.post')
-    def test_analyze_cv_timeout(
-        self, 
-        mock_post, 
-        groq_service, 
-        sample_cv_text, 
-        sample_job_description
-    ):
-        """Test CV analysis with timeout."""
-        import requests
-        mock_post.side_effect = requests.exceptions.Timeout()
-        
-        with pytest.raises(GroqAPIError, match="Request timed out"):
-            groq_service.analyze_cv(sample_cv_text, sample_job_description)
-    
-    @patch('cv_analyzer.services.groq_service.requests.post')
-    def test_analyze_cv_network_error(
-        self, 
-        mock_post, 
-        groq_service, 
-        sample_cv_text, 
-        sample_job_description
-    ):
-        """Test CV analysis with network error."""
-        import requests
-        mock_post.side_effect = requests.exceptions.ConnectionError("Network error")
-        
-        with pytest.raises(GroqAPIError, match="Network error"):
-            groq_service.analyze_cv(sample_cv_text, sample_job_description)
-    
-    @patch('cv_analyzer.services.groq_service.requests.post')
-    def test_analyze_cv_invalid_json_response(
-        self, 
-        mock_post, 
-        groq_service, 
-        sample_cv_text, 
-        sample_job_description
-    ):
-        """Test CV analysis with invalid JSON in response."""
-        # Setup mock
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "choices": [
-                {
-                    "message": {
-                        "content": "This is not valid JSON"
-                    }
-                }
-            ]
-        }
-        mock_post.return_value = mock_response
-        
-        # Execute and verify
-        with pytest.raises(GroqAPIError, match="Invalid JSON response"):
-            groq_service.analyze_cv(sample_cv_text, sample_job_description)
-    
-    @patch('cv_analyzer.services.groq_service.requests.post')
-    def test_analyze_cv_missing_required_fields(
-        self, 
-        mock_post, 
-        groq_service, 
-        sample_cv_text, 
-        sample_job_description
-    ):
-        """Test CV analysis with incomplete data."""
-        # Setup mock with missing fields
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "choices": [
-                {
-                    "message": {
-                        "content": json.dumps({
-                            "overall_score": 75,
-                            "strengths": ["Python"],
-                            # Missing required fields
-                        })
-                    }
-                }
-            ]
-        }
-        mock_post.return_value = mock_response
-        
-        # Execute and verify - should raise validation error
-        with pytest.raises(GroqAPIError):
-            groq_service.analyze_cv(sample_cv_text, sample_job_description)
-    
-    @patch('cv_analyzer.services.groq_service.requests.post')
-    def test_test_connection_success(self, mock_post, groq_service):
-        """Test successful connection test."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_post.return_value = mock_response
-        
-        result = groq_service.test_connection()
-        
-        assert result is True
-        mock_post.assert_called_once()
-    
-    @patch('cv_analyzer.services.groq_service.requests.post')
-    def test_test_connection_failure(self, mock_post, groq_service):
-        """Test failed connection test."""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_post.return_value = mock_response
-        
-        result = groq_service.test_connection()
-        
-        assert result is False
-    
-    @patch('cv_analyzer.services.groq_service.requests.post')
-    def test_test_connection_exception(self, mock_post, groq_service):
-        """Test connection test with exception."""
-        import requests
-        mock_post.side_effect = requests.exceptions.ConnectionError()
-        
-        result = groq_service.test_connection()
-        
-        assert result is False
-    
-    def test_analyze_cv_validates_pydantic_model(
-        self, 
-        groq_service, 
-        sample_cv_text, 
-        sample_job_description
-    ):
-        """Test that analysis result is validated by Pydantic."""
-        with patch('cv_analyzer.services.groq_service.requests.post') as mock_post:
-            # Setup mock with score out of range
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "choices": [
-                    {
-                        "message": {
-                            "content": json.dumps({
-                                "overall_score": 150,  # Invalid: > 100
-                                "strengths": ["Python"],
-                                "missing_skills": ["Go"],
-                                "gaps_analysis": "Test",
-                                "youtube_search_query": "test"
-                            })
-                        }
-                    }
-                ]
-            }
-            mock_post.return_value = mock_response
-            
-            # Should raise error due to Pydantic validation
-            with pytest.raises(GroqAPIError):
-                groq_service.analyze_cv(sample_cv_text, sample_job_description)
\ No newline at end of file
+"""
+Tests for Groq API service.
+"""
+
+import pytest
+import json
+from unittest.mock import Mock, patch, MagicMock
+
+import cv_analyser.services.groq_service as groq_module
+from cv_analyser.services.groq_service import GroqService, GroqAPIError
+from cv_analyser.models.schemas import CVAnalysis
+from cv_analyser.config import get_settings
+
+
+# Valid wire-format response (CVAnalysisRaw schema) used across tests
+_RAW_ANALYSIS = {
+    "overall_score": 75,
+    "skills_match": 80,
+    "experience_match": 70,
+    "education_match": 85,
+    "matching_skills": [
+        "Strong Python programming skills",
+        "Experience with Docker and Kubernetes",
+        "AWS cloud deployment knowledge"
+    ],
+    "missing_skills": [
+        "GraphQL API experience",
+        "Go or Rust programming",
+        "Machine learning background"
+    ],
+    "youtube_search_query": "GraphQL tutorial, latest on youtube",
+    "skill_gap_analysis_summary": (
+        "The candidate demonstrates solid backend development skills with "
+        "strong Python experience and DevOps capabilities. However, there "
+        "are notable gaps in modern API technologies like GraphQL."
+    ),
+}
+
+
+def _mk_stream(text, chunk_size=40):
+    """Build a mock streamed completion delivering `text` in deltas."""
+    chunks = []
+    for i in range(0, len(text), chunk_size):
+        chunk = Mock()
+        chunk.choices = [Mock(delta=Mock(content=text[i:i + chunk_size]))]
+        chunks.append(chunk)
+    stream = MagicMock()
+    stream.__iter__.return_value = iter(chunks)
+    return stream
+
+
+class TestGroqService:
+    """Test cases for GroqService class."""
+
+    @pytest.fixture(autouse=True)
+    def clear_analysis_cache(self):
+        """Keep the module-level analysis cache from leaking across tests."""
+        groq_module._ANALYSIS_CACHE.clear()
+        yield
+        groq_module._ANALYSIS_CACHE.clear()
+
+    @pytest.fixture
+    def groq_service(self, monkeypatch):
+        """Create GroqService instance for testing."""
+        monkeypatch.setenv("GROQ_API_KEY", "test_groq_key_12345")
+        monkeypatch.setenv("SERPER_API_KEY", "test_serper_key_12345")
+        get_settings.cache_clear()
+        yield GroqService(api_key="test_groq_key_12345")
+        get_settings.cache_clear()
+
+    def test_initialization_with_api_key(self, groq_service):
+        """Test service initialization with API key."""
+        assert groq_service.api_key == "test_groq_key_12345"
+        assert groq_service.client is not None
+
+    def test_initialization_without_api_key_raises_error(self, monkeypatch):
+        """Test that initialization without API key raises ValueError."""
+        monkeypatch.delenv("GROQ_API_KEY", raising=False)
+        monkeypatch.delenv("SERPER_API_KEY", raising=False)
+        get_settings.cache_clear()
+        with pytest.raises(ValueError, match="Groq API key not provided"):
+            GroqService()
+        get_settings.cache_clear()
+
+    def test_build_analysis_prompt(self, groq_service, sample_cv_text, sample_job_description):
+        """Test prompt building."""
+        prompt = groq_service._build_analysis_prompt(sample_cv_text, sample_job_description)
+
+        assert "CV TEXT:" in prompt
+        assert "JOB DESCRIPTION:" in prompt
+        assert "John Doe" in prompt
+        assert "Senior Backend Engineer" in prompt
+
+    def test_analyze_cv_success(
+        self, fast_json, groq_service, sample_cv_text, sample_job_description
+    ):
+        """Test successful CV analysis."""
+        with patch.object(
+            groq_service.client.chat.completions, 'create',
+            return_value=_mk_stream(json.dumps(_RAW_ANALYSIS)),
+        ) as mock_create:
+            result = groq_service.analyze_cv(sample_cv_text, sample_job_description)
+
+        # Verify the wire schema maps onto CVAnalysis
+        assert isinstance(result, CVAnalysis)
+        assert result.overall_score == 75
+        assert len(result.strengths) == 3
+        assert len(result.missing_skills) == 3
+        assert "Python" in result.strengths[0]
+        assert result.youtube_search_query == "GraphQL tutorial, latest on youtube"
+
+        # Verify API call went through the streaming SDK path
+        mock_create.assert_called_once()
+        assert mock_create.call_args[1]["stream"] is True
+
+    def test_analyze_cv_drops_sentinel_skills(
+        self, groq_service, sample_cv_text, sample_job_description
+    ):
+        """Test that placeholder entries never surface as skills."""
+        payload = dict(_RAW_ANALYSIS)
+        payload["matching_skills"] = ["Not specified", "Strong Python skills"]
+        payload["missing_skills"] = ["Not specified"]
+        with patch.object(
+            groq_service.client.chat.completions, 'create',
+            return_value=_mk_stream(json.dumps(payload)),
+        ):
+            result = groq_service.analyze_cv(sample_cv_text, sample_job_description)
+
+        # Sentinels are stripped during normalization: real entries survive,
+        # sentinel-only lists come back empty rather than as fake skills
+        assert result.strengths == ["Strong Python skills"]
+        assert result.missing_skills == []
+
+    def test_analyze_cv_result_is_cached(
+        self, groq_service, sample_cv_text, sample_job_description
+    ):
+        """Test that an identical CV/JD pair skips the second API call."""
+        with patch.object(
+            groq_service.client.chat.completions, 'create',
+            side_effect=lambda **kwargs: _mk_stream(json.dumps(_RAW_ANALYSIS)),
+        ) as mock_create:
+            first = groq_service.analyze_cv(sample_cv_text, sample_job_description)
+            second = groq_service.analyze_cv(sample_cv_text, sample_job_description)
+
+        assert first == second
+        mock_create.assert_called_once()
+
+    def test_analyze_cv_authentication_error(
+        self, groq_service, sample_cv_text, sample_job_description
+    ):
+        """Test CV analysis surfaces authentication failures clearly."""
+        with patch.object(
+            groq_service.client.chat.completions, 'create',
+            side_effect=Exception("Error code: 401 - authentication failed"),
+        ):
+            with pytest.raises(GroqAPIError, match="Invalid API key"):
+                groq_service.analyze_cv(sample_cv_text, sample_job_description)
+
+    def test_analyze_cv_invalid_json_response(
+        self, fast_json, groq_service, sample_cv_text, sample_job_description
+    ):
+        """Test CV analysis with invalid JSON in response."""
+        with patch.object(
+            groq_service.client.chat.completions, 'create',
+            return_value=_mk_stream("This is not valid JSON"),
+        ):
+            with pytest.raises(GroqAPIError, match="did not return JSON"):
+                groq_service.analyze_cv(sample_cv_text, sample_job_description)
+
+    def test_analyze_cv_empty_analysis(
+        self, groq_service, sample_cv_text, sample_job_description
+    ):
+        """Test that a structurally valid but empty analysis is rejected."""
+        empty = {
+            "overall_score": 0,
+            "skills_match": 0,
+            "experience_match": 0,
+            "education_match": 0,
+            "matching_skills": [],
+            "missing_skills": [],
+            "youtube_search_query": "",
+            "skill_gap_analysis_summary": "",
+        }
+        with patch.object(
+            groq_service.client.chat.completions, 'create',
+            return_value=_mk_stream(json.dumps(empty)),
+        ):
+            with pytest.raises(GroqAPIError, match="empty analysis"):
+                groq_service.analyze_cv(sample_cv_text, sample_job_description)
+
+    def test_test_connection_success(self, groq_service):
+        """Test successful connection test."""
+        with patch.object(
+            groq_service.client.chat.completions, 'create', return_value=Mock()
+        ) as mock_create:
+            assert groq_service.test_connection() is True
+        mock_create.assert_called_once()
+
+    def test_test_connection_failure(self, groq_service):
+        """Test failed connection test."""
+        with patch.object(
+            groq_service.client.chat.completions, 'create',
+            side_effect=Exception("connection refused"),
+        ):
+            assert groq_service.test_connection() is False